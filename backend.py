@@ -1,45 +1,70 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 from typing import Dict, Any, Optional
 from datetime import datetime
+import asyncio
+import functools
+import gzip
+import hashlib
 import json
 import os
+import re
 import logging
+import time
 import traceback
+import msgspec
+import orjson
 from dotenv import load_dotenv
-from ms_ews_email_env import MsEwsClient
+from jinja2 import Environment
+from ms_ews_email_env import get_shared_client
 
+# Load .env file (will NOT override existing shell environment variables)
+load_dotenv(override=False)
+
+_requested_log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+# getLevelName returns the numeric level for known names, a "Level X" string otherwise
+LOG_LEVEL = _requested_log_level if isinstance(logging.getLevelName(_requested_log_level), int) else 'INFO'
+
+# force=True: ms_ews_email_env already configured the root logger on import
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=LOG_LEVEL,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    force=True
 )
 logger = logging.getLogger(__name__)
-
-# Load .env file (will NOT override existing shell environment variables)
-load_dotenv(override=False)
+if LOG_LEVEL != _requested_log_level:
+    logger.warning("Unknown LOG_LEVEL %r, falling back to INFO", _requested_log_level)
 
 # Load debug mode configuration
 DEBUG_MODE = os.getenv('DEBUG_MODE', 'false').lower() in ['true', '1', 'yes']
 
-logger.info("=" * 80)
+# Snapshot email configuration once instead of reading the environment per request
+EWS_RECIPIENT_ADDRESS = os.getenv('EWS_RECIPIENT_ADDRESS')
+
+_SEP = "=" * 80
+
+logger.info(_SEP)
 logger.info("BACKEND STARTUP")
-logger.info("=" * 80)
+logger.info(_SEP)
 logger.info("Using Microsoft Exchange OAuth for email")
 logger.info("Environment variable sources:")
 logger.info("  - Shell environment variables take precedence")
 logger.info("  - .env file used as fallback")
-logger.info(f"DEBUG_MODE: {DEBUG_MODE}")
-logger.info(f"EWS_SENDER_ADDRESS: {os.getenv('EWS_SENDER_ADDRESS', 'Not set')}")
-logger.info(f"EWS_RECIPIENT_ADDRESS: {os.getenv('EWS_RECIPIENT_ADDRESS', 'Not set')}")
-logger.info(f"EWS_CLIENT_ID: {os.getenv('EWS_CLIENT_ID', 'Not set')}")
-logger.info(f"EWS_TENANT_ID: {os.getenv('EWS_TENANT_ID', 'Not set')}")
-logger.info(f"EWS_CLIENT_SECRET: {'*' * len(os.getenv('EWS_CLIENT_SECRET', '')) if os.getenv('EWS_CLIENT_SECRET') else 'Not set'}")
-logger.info("=" * 80)
+logger.info("DEBUG_MODE: %s", DEBUG_MODE)
+logger.info("LOG_LEVEL: %s", LOG_LEVEL)
+logger.info("EWS_SENDER_ADDRESS: %s", os.getenv('EWS_SENDER_ADDRESS', 'Not set'))
+logger.info("EWS_RECIPIENT_ADDRESS: %s", EWS_RECIPIENT_ADDRESS or 'Not set')
+logger.info("EWS_CLIENT_ID: %s", os.getenv('EWS_CLIENT_ID', 'Not set'))
+logger.info("EWS_TENANT_ID: %s", os.getenv('EWS_TENANT_ID', 'Not set'))
+logger.info("EWS_CLIENT_SECRET: %s", 'set' if os.getenv('EWS_CLIENT_SECRET') else 'Not set')
+logger.info(_SEP)
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -49,6 +74,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class DynamicGZipMiddleware(GZipMiddleware):
+    """GZip middleware that skips the pre-compressed landing page and already compressed images"""
+
+    SKIP_SUFFIXES = (".png", ".ico", ".jpg", ".jpeg", ".gif", ".webp")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path == "/" or path.lower().endswith(self.SKIP_SUFFIXES):
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+
+app.add_middleware(DynamicGZipMiddleware, minimum_size=500, compresslevel=6)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -57,7 +97,8 @@ async def get_debug_mode():
     """Return the current debug mode status"""
     return {"debug_mode": DEBUG_MODE}
 
-class AssessmentData(BaseModel):
+class AssessmentData(msgspec.Struct, kw_only=True):
+    """Assessment payload; decoded with msgspec, unknown fields are ignored"""
     scores: Dict[str, float]
     totalScore: float
     maturityLevel: str
@@ -66,155 +107,297 @@ class AssessmentData(BaseModel):
     userAnswers: Dict[str, Any]
     timestamp: Optional[str] = None
 
-def send_email(data: AssessmentData, recipient_email: str = None):
-    """Send assessment results via email using Microsoft Exchange"""
-
-    # Use environment variable if no recipient is specified
-    if recipient_email is None:
-        recipient_email = os.getenv('EWS_RECIPIENT_ADDRESS')
-        if not recipient_email:
-            raise HTTPException(
-                status_code=500,
-                detail="No recipient email specified and EWS_RECIPIENT_ADDRESS environment variable not set"
-            )
-        logger.info(f"Using recipient email from EWS_RECIPIENT_ADDRESS environment variable: {recipient_email}")
+# msgspec bypasses FastAPI's body parsing, so publish the schema for /docs explicitly
+_, _assessment_schemas = msgspec.json.schema_components([AssessmentData])
+ASSESSMENT_REQUEST_BODY = {
+    "required": True,
+    "content": {"application/json": {"schema": _assessment_schemas["AssessmentData"]}}
+}
+
+def _validation_errors(error: msgspec.DecodeError) -> list:
+    """Translate a msgspec error into FastAPI's 422 error list format"""
+    message, _, path = str(error).partition(" - at `")
+    loc = ["body"]
+    loc += [key or int(index) for key, index in re.findall(r"\.(\w+)|\[(\d+)\]", path)]
+    missing = re.search(r"missing required field `(\w+)`", message)
+    if missing:
+        loc.append(missing.group(1))
+        error_type = "missing"
+    elif isinstance(error, msgspec.ValidationError):
+        error_type = "value_error"
     else:
-        logger.info(f"Using explicitly provided recipient email: {recipient_email}")
-
-    logger.info("=" * 80)
-    logger.info("EMAIL SENDING PROCESS STARTED (Exchange OAuth)")
-    logger.info(f"Recipient: {recipient_email}")
-    logger.info(f"Maturity Level: {data.maturityLevel}")
-    logger.info(f"Total Score: {data.totalScore}")
-    logger.info(f"Has Contact Info: {bool(data.contactInfo)}")
-    if data.contactInfo:
-        logger.info(f"Contact: {data.contactInfo.get('name', 'No name')} - {data.contactInfo.get('email', 'No email')}")
-    logger.info("=" * 80)
-
+        error_type = "json_invalid"
+    return [{"type": error_type, "loc": loc, "msg": message}]
+
+# Compiled once at import; autoescape keeps user-supplied text from injecting HTML
+_jinja_env = Environment(autoescape=True)
+
+EMAIL_TEMPLATE = _jinja_env.from_string("""
+    <html>
+      <body style="font-family: Arial, sans-serif; padding: 20px;">
+        <h2>KI-Reifegradanalyse Ergebnisse</h2>
+        <p><strong>Datum:</strong> {{ timestamp }}</p>
+        {% if contact %}
+        <h3>Kontaktinformationen:</h3>
+        <ul>
+            <li><strong>Name:</strong> {{ contact.get('name', 'N/A') }}</li>
+            <li><strong>E-Mail:</strong> {{ contact.get('email', 'N/A') }}</li>
+            <li><strong>Telefon:</strong> {{ contact.get('phone', 'N/A') }}</li>
+            <li><strong>Unternehmen:</strong> {{ contact.get('company', 'N/A') }}</li>
+        </ul>
+        {% endif %}
+        <h3>Gesamtergebnis:</h3>
+        <p><strong>Gesamtscore:</strong> {{ '%.1f' | format(total_score) }}%</p>
+        <p><strong>Reifegrad:</strong> {{ maturity_level }}</p>
+
+        <h3>Kategorie-Scores:</h3>
+        <ul>
+            {% for cat, score in scores %}<li><strong>{{ cat }}:</strong> {{ '%.1f' | format(score) }}%</li>{% endfor %}
+        </ul>
+
+        <h3>Handlungsempfehlungen:</h3>
+        <ul>
+            {% for cat, insight in insights %}<li><strong>{{ cat }}:</strong> {{ insight }}</li>{% endfor %}
+        </ul>
+
+        <h3>Detaillierte Antworten:</h3>
+        <pre style="background-color: #f5f5f5; padding: 10px; border-radius: 5px;">
+{{ answers_json }}
+        </pre>
+      </body>
+    </html>
+""")
+
+def build_email(data: AssessmentData):
+    """Render subject and HTML body for the assessment results email"""
     try:
-        ews_client = MsEwsClient()
-
-        if not ews_client.test_connection():
-            logger.error("Failed to connect to Exchange server")
-            raise HTTPException(status_code=500, detail="Failed to connect to email server")
-
-        contact_info_html = ""
-        if data.contactInfo:
-            contact_info_html = f"""
-            <h3>Kontaktinformationen:</h3>
-            <ul>
-                <li><strong>Name:</strong> {data.contactInfo.get('name', 'N/A')}</li>
-                <li><strong>E-Mail:</strong> {data.contactInfo.get('email', 'N/A')}</li>
-                <li><strong>Telefon:</strong> {data.contactInfo.get('phone', 'N/A')}</li>
-                <li><strong>Unternehmen:</strong> {data.contactInfo.get('company', 'N/A')}</li>
-            </ul>
-            """
-
-        html_body = f"""
-        <html>
-          <body style="font-family: Arial, sans-serif; padding: 20px;">
-            <h2>KI-Reifegradanalyse Ergebnisse</h2>
-            <p><strong>Datum:</strong> {data.timestamp or datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
-
-            {contact_info_html}
-
-            <h3>Gesamtergebnis:</h3>
-            <p><strong>Gesamtscore:</strong> {data.totalScore:.1f}%</p>
-            <p><strong>Reifegrad:</strong> {data.maturityLevel}</p>
-
-            <h3>Kategorie-Scores:</h3>
-            <ul>
-                {"".join([f"<li><strong>{cat}:</strong> {score:.1f}%</li>" for cat, score in data.scores.items()])}
-            </ul>
-
-            <h3>Handlungsempfehlungen:</h3>
-            <ul>
-                {"".join([f"<li><strong>{cat}:</strong> {insight}</li>" for cat, insight in data.insights.items()])}
-            </ul>
-
-            <h3>Detaillierte Antworten:</h3>
-            <pre style="background-color: #f5f5f5; padding: 10px; border-radius: 5px;">
-{json.dumps(data.userAnswers, indent=2, ensure_ascii=False)}
-            </pre>
-          </body>
-        </html>
-        """
-
-        subject = f"KI-Reifegradanalyse Ergebnisse - {data.maturityLevel}"
-
-        logger.info(f"Sending email via Exchange to {recipient_email}...")
-        ews_client.send_message(
-            subject=subject,
-            body=html_body,
-            recipient=recipient_email,
-            html_body=True
+        answers_json = orjson.dumps(
+            data.userAnswers,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects e.g. integers beyond 64 bit, which are still valid JSON
+        answers_json = json.dumps(data.userAnswers, indent=2, ensure_ascii=False)
+
+    html_body = EMAIL_TEMPLATE.render(
+        timestamp=data.timestamp or datetime.now().strftime('%Y-%m-%d %H:%M'),
+        contact=data.contactInfo,
+        total_score=data.totalScore,
+        maturity_level=data.maturityLevel,
+        scores=data.scores.items(),
+        insights=data.insights.items(),
+        answers_json=answers_json
+    )
+
+    subject = f"KI-Reifegradanalyse Ergebnisse - {data.maturityLevel}"
+    return subject, html_body
+
+class EmailBatcher:
+    """
+    Collects outgoing emails on an asyncio queue and delivers them in batches,
+    so that concurrent submissions share a single EWS CreateItem round-trip
+    """
+
+    def __init__(self, max_batch: int = 16, max_wait: float = 0.02,
+                 max_attempts: int = 3, retry_delay: float = 2.0):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._queue = None
+        self._task = None
+        self._retries = set()
+
+    def start(self):
+        """Start the delivery worker on the running event loop"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Deliver everything still queued or waiting for a retry, then stop the worker"""
+        if self._task is None:
+            return
+        while True:
+            if self._retries:
+                await asyncio.gather(*self._retries, return_exceptions=True)
+            await self._queue.join()
+            if not self._retries:
+                break
+        self._task.cancel()
+        self._task = None
+
+    def submit(self, subject: str, body: str, recipient: str) -> asyncio.Future:
+        """Queue an HTML email; the returned future resolves once it was sent"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((subject, body, recipient, future, 1))
+        return future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._deliver(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _deliver(self, batch):
+        logger.info("Sending batch of %d email(s) via Exchange...", len(batch))
+        messages = [(subject, body, recipient) for subject, body, recipient, _, _ in batch]
+        try:
+            results = await run_in_threadpool(get_shared_client().send_messages, messages)
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (subject, body, recipient, future, attempt), result in zip(batch, results):
+            if future.done():
+                continue
+            if not isinstance(result, Exception):
+                future.set_result(True)
+            elif attempt < self.max_attempts:
+                delay = self.retry_delay * 2 ** (attempt - 1)
+                logger.warning(
+                    "Email to %s failed (attempt %d/%d), retrying in %.0fs: %s",
+                    recipient, attempt, self.max_attempts, delay, result
+                )
+                self._schedule_retry((subject, body, recipient, future, attempt + 1), delay)
+            else:
+                # The client already got a success response; keep everything needed to resend by hand
+                logger.error(
+                    "Giving up on email to %s after %d attempts: %s\nSubject: %s\nBody:\n%s",
+                    recipient, attempt, result, subject, body
+                )
+                future.set_exception(result)
+
+    def _schedule_retry(self, item, delay: float):
+        task = asyncio.create_task(self._requeue(item, delay))
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+    async def _requeue(self, item, delay: float):
+        await asyncio.sleep(delay)
+        self._queue.put_nowait(item)
+
+email_batcher = EmailBatcher()
+
+@app.on_event("startup")
+async def start_email_batcher():
+    email_batcher.start()
+
+@app.on_event("shutdown")
+async def stop_email_batcher():
+    await email_batcher.stop()
+
+def _log_delivery_result(data: AssessmentData, future: asyncio.Future):
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        contact = data.contactInfo or {}
+        logger.error(
+            "Background email delivery failed: %s: %s (submitted %s, level=%s, score=%s, "
+            "contact=%s <%s>, company=%s, phone=%s)",
+            type(error).__name__, error, data.timestamp, data.maturityLevel, data.totalScore,
+            contact.get('name', 'N/A'), contact.get('email', 'N/A'),
+            contact.get('company', 'N/A'), contact.get('phone', 'N/A')
         )
-
-        logger.info("=" * 80)
+    else:
         logger.info("EMAIL PROCESS COMPLETED SUCCESSFULLY (Exchange)")
-        logger.info("=" * 80)
-        return True
 
-    except Exception as e:
-        logger.error("=" * 80)
-        logger.error(f"ERROR SENDING EMAIL: {str(e)}")
-        logger.error(f"Error Type: {type(e).__name__}")
-        logger.error("Full traceback:")
-        logger.error(traceback.format_exc())
-        logger.error("=" * 80)
-        raise HTTPException(status_code=500, detail=f"Failed to send email: {str(e)}")
-
-@app.post("/api/submit-assessment")
-async def submit_assessment(data: AssessmentData):
-    """Receive assessment data and send via email"""
-    logger.info("=" * 80)
-    logger.info("NEW ASSESSMENT SUBMISSION RECEIVED")
-    logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(f"Total Score: {data.totalScore}")
-    logger.info(f"Maturity Level: {data.maturityLevel}")
-    logger.info("Category Scores:")
-    for category, score in data.scores.items():
-        logger.info(f"  - {category}: {score:.1f}%")
-    logger.info("=" * 80)
+@app.post("/api/submit-assessment", openapi_extra={"requestBody": ASSESSMENT_REQUEST_BODY})
+async def submit_assessment(request: Request):
+    """Receive assessment data and queue the results email"""
+    try:
+        data = msgspec.json.decode(await request.body(), type=AssessmentData)
+    except msgspec.DecodeError as e:
+        # ValidationError is a subclass of DecodeError
+        logger.error("Invalid assessment payload: %s", e)
+        raise RequestValidationError(_validation_errors(e))
+
+    logger.info("New assessment submission: score=%s level=%s", data.totalScore, data.maturityLevel)
+    if logger.isEnabledFor(logging.DEBUG):
+        for category, score in data.scores.items():
+            logger.debug("  - %s: %.1f%%", category, score)
 
     try:
         data.timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        logger.info("Calling send_email function...")
-        send_email(data)
-        logger.info("send_email function returned successfully")
+        recipient_email = EWS_RECIPIENT_ADDRESS
+        if not recipient_email:
+            raise HTTPException(
+                status_code=500,
+                detail="No recipient email specified and EWS_RECIPIENT_ADDRESS environment variable not set"
+            )
+
+        # Delivery happens on the batch worker after the response is sent
+        subject, html_body = build_email(data)
+        logger.debug("Queueing email to %s...", recipient_email)
+        future = email_batcher.submit(subject, html_body, recipient_email)
+        future.add_done_callback(functools.partial(_log_delivery_result, data))
 
         response = {
             "status": "success",
-            "message": "Assessment results sent successfully",
+            "message": "Assessment results accepted for sending",
             "timestamp": data.timestamp
         }
-        logger.info(f"Returning success response: {response}")
+        logger.debug("Returning success response: %s", response)
         return response
 
     except HTTPException as he:
-        logger.error(f"HTTP Exception in submit_assessment: {str(he.detail)}")
+        logger.error("HTTP Exception in submit_assessment: %s", he.detail)
         raise he
 
     except Exception as e:
-        logger.error("=" * 80)
-        logger.error(f"UNEXPECTED ERROR in submit_assessment: {str(e)}")
-        logger.error(f"Error Type: {type(e).__name__}")
-        logger.error("Full traceback:")
-        logger.error(traceback.format_exc())
-        logger.error("=" * 80)
+        logger.error(_SEP)
+        logger.error("UNEXPECTED ERROR in submit_assessment: %s", e)
+        logger.error("Error Type: %s", type(e).__name__)
+        logger.error("Full traceback:\n%s", traceback.format_exc())
+        logger.error(_SEP)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 
+# The landing page is small and static; read and gzip it once instead of per request
+with open("static/index.html", "rb") as f:
+    INDEX_HTML = f.read()
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML, compresslevel=9, mtime=0)
+_index_md5 = hashlib.md5(INDEX_HTML).hexdigest()
+INDEX_HEADERS = {
+    "ETag": f'"{_index_md5}"',
+    "Cache-Control": "public, max-age=300",
+    "Vary": "Accept-Encoding"
+}
+INDEX_GZIP_NOT_MODIFIED_HEADERS = {**INDEX_HEADERS, "ETag": f'"{_index_md5}-gzip"'}
+INDEX_GZIP_HEADERS = {**INDEX_GZIP_NOT_MODIFIED_HEADERS, "Content-Encoding": "gzip"}
+
 @app.get("/")
-async def serve_html():
-    """Serve the HTML file"""
-    return FileResponse("static/index.html", media_type="text/html")
+async def serve_html(request: Request):
+    """Serve the HTML file, gzipped when the client accepts it"""
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        content, headers, not_modified_headers = INDEX_HTML_GZIP, INDEX_GZIP_HEADERS, INDEX_GZIP_NOT_MODIFIED_HEADERS
+    else:
+        content, headers, not_modified_headers = INDEX_HTML, INDEX_HEADERS, INDEX_HEADERS
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=not_modified_headers)
+    return Response(content=content, media_type="text/html", headers=headers)
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint that also verifies Exchange connection"""
+# Deep Exchange checks hit the mailbox, so their result is reused for a while
+# and refreshed in the background at the same interval
+DEEP_HEALTH_TTL = 30
+_deep_health = {"checked_at": None, "email_status": None}
+
+def _health_response(check) -> dict:
     try:
         health = {
             "status": "healthy",
@@ -223,27 +406,80 @@ async def health_check():
         }
 
         try:
-            ews_client = MsEwsClient()
-            if ews_client.test_connection():
-                health["email_status"] = "connected"
-            else:
-                health["email_status"] = "disconnected"
+            health["email_status"] = check()
         except Exception as e:
             health["email_status"] = f"error: {str(e)}"
 
         return health
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return {
             "status": "unhealthy",
             "timestamp": datetime.now().isoformat(),
             "error": str(e)
         }
 
+def _deep_email_status() -> str:
+    now = time.monotonic()
+    checked_at = _deep_health["checked_at"]
+    if checked_at is None or now - checked_at >= DEEP_HEALTH_TTL:
+        try:
+            connected = get_shared_client().test_connection()
+            _deep_health["email_status"] = "connected" if connected else "disconnected"
+        except Exception as e:
+            _deep_health["email_status"] = f"error: {str(e)}"
+        _deep_health["checked_at"] = now
+    return _deep_health["email_status"]
+
+# Latest result of the background poller; served verbatim by /api/health
+_health = {
+    "status": "healthy",
+    "timestamp": datetime.now().isoformat(),
+    "email_backend": "Microsoft Exchange (OAuth)",
+    "email_status": "unknown"
+}
+
+async def _health_poller():
+    global _health
+    while True:
+        health = await run_in_threadpool(_health_response, _deep_email_status)
+        if health.get("email_status") != _health.get("email_status"):
+            logger.info("Exchange health status: %s", health.get("email_status"))
+        _health = health
+        await asyncio.sleep(DEEP_HEALTH_TTL)
+
+_health_poller_task = None
+
+@app.on_event("startup")
+async def start_health_poller():
+    global _health_poller_task
+    _health_poller_task = asyncio.create_task(_health_poller())
+
+@app.on_event("shutdown")
+async def stop_health_poller():
+    if _health_poller_task is not None:
+        _health_poller_task.cancel()
+
+@app.get("/api/health")
+async def health_check():
+    """Health check endpoint; returns the Exchange status from the background poller"""
+    return _health
+
+@app.get("/api/health/deep")
+async def deep_health_check():
+    """Health check endpoint that also verifies mailbox access on the Exchange server"""
+    return await run_in_threadpool(_health_response, _deep_email_status)
+
 def main():
     """Main entry point for production server"""
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "backend:app",
+        host="0.0.0.0",
+        port=8000,
+        # Each worker runs its own EmailBatcher and health poller
+        workers=int(os.getenv('WEB_CONCURRENCY', 1))
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,7 +7,6 @@ import logging
 from typing import Optional, List
 from datetime import datetime
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
 from exchangelib import (
     Configuration, Account, Message, Mailbox,
@@ -130,14 +129,11 @@ class MsEwsMain:
         Returns:
             Authenticated Account object
         """
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(
-                MsEwsTokenProvider.get_access_token,
-                cls.CLIENT_ID,
-                cls.CLIENT_SECRET,
-                cls.TENANT_ID
-            )
-            token = future.result()
+        token = MsEwsTokenProvider.get_access_token(
+            cls.CLIENT_ID,
+            cls.CLIENT_SECRET,
+            cls.TENANT_ID
+        )
 
         return cls.get_authenticated_service(token, cls.SENDER_ADDRESS)
 
@@ -192,34 +188,31 @@ class MsEwsMain:
         """
         logger.info("Starting Microsoft Exchange EWS OAuth2 client")
 
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            # Get access token
-            future = executor.submit(
-                MsEwsTokenProvider.get_access_token,
-                cls.CLIENT_ID,
-                cls.CLIENT_SECRET,
-                cls.TENANT_ID
-            )
-            token = future.result()
-
-            # Don't log this in production!
-            logger.debug(f"Token acquired (length: {len(token)} chars)")
-
-            # Test mailbox read access
-            logger.info("Getting emails from inbox...")
-            try:
-                account = cls.get_authenticated_service(token, cls.SENDER_ADDRESS)
-                cls.list_inbox_messages(account)
-            except Exception as e:
-                logger.error(f"Error reading inbox: {e}")
+        # Get access token
+        token = MsEwsTokenProvider.get_access_token(
+            cls.CLIENT_ID,
+            cls.CLIENT_SECRET,
+            cls.TENANT_ID
+        )
 
-            # Send a test message
-            logger.info("Sending a test message...")
-            try:
-                account = cls.get_authenticated_service(token, cls.SENDER_ADDRESS)
-                cls.send_test_message(account, cls.RECIPIENT_ADDRESS, cls.SENDER_ADDRESS)
-            except Exception as e:
-                logger.error(f"Error sending message: {e}")
+        # Don't log this in production!
+        logger.debug(f"Token acquired (length: {len(token)} chars)")
+
+        # Test mailbox read access
+        logger.info("Getting emails from inbox...")
+        try:
+            account = cls.get_authenticated_service(token, cls.SENDER_ADDRESS)
+            cls.list_inbox_messages(account)
+        except Exception as e:
+            logger.error(f"Error reading inbox: {e}")
+
+        # Send a test message
+        logger.info("Sending a test message...")
+        try:
+            account = cls.get_authenticated_service(token, cls.SENDER_ADDRESS)
+            cls.send_test_message(account, cls.RECIPIENT_ADDRESS, cls.SENDER_ADDRESS)
+        except Exception as e:
+            logger.error(f"Error sending message: {e}")
 
         logger.info("Finished")
 
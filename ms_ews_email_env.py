@@ -4,7 +4,9 @@ Enhanced version that reads configuration from environment variables
 """
 
 import os
+import time
 import logging
+import threading
 from typing import Optional, List
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
@@ -13,11 +15,14 @@ from dotenv import load_dotenv
 from exchangelib import (
     Configuration, Account, Message, Mailbox,
     FileAttachment, HTMLBody, OAUTH2, Identity,
-    OAuth2AuthorizationCodeCredentials, IMPERSONATION
+    OAuth2AuthorizationCodeCredentials, IMPERSONATION, Version, Build
 )
-from exchangelib.protocol import BaseProtocol
+from exchangelib.items import SEND_AND_SAVE_COPY
+from exchangelib.protocol import BaseProtocol, CachingProtocol
 import requests
-from msal import ConfidentialClientApplication
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from msal import ConfidentialClientApplication, SerializableTokenCache
 
 # Load .env file (will NOT override existing shell environment variables)
 load_dotenv(override=False)
@@ -25,14 +30,55 @@ load_dotenv(override=False)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Exchange Online build; pinning it skips exchangelib's version discovery request
+EXCHANGE_O365_VERSION = Version(build=Build(15, 20))
+
+# exchangelib defaults to a single EWS session per protocol; allow batch sends
+# and health checks on the shared Account to run without queueing behind each other
+BaseProtocol.SESSION_POOLSIZE = 4
+
+# Keep-alive session for token requests to login.microsoftonline.com
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+
 
 class MsEwsTokenProvider:
     """Provides OAuth2 access tokens for Microsoft Exchange"""
 
-    @staticmethod
-    def get_access_token(client_id: str, client_secret: str, tenant_id: str) -> str:
+    # Tokens are valid for ~1 hour; refresh this many seconds before expiry
+    EXPIRY_MARGIN = 60
+
+    _lock = threading.Lock()
+    _apps = {}
+    _token = None
+    _token_key = None
+    _token_expiry = 0.0
+
+    @classmethod
+    def _get_app(cls, client_id: str, client_secret: str, tenant_id: str) -> ConfidentialClientApplication:
+        """Return a long-lived MSAL app (with its own token cache) per credential set"""
+        key = (client_id, client_secret, tenant_id)
+        app = cls._apps.get(key)
+        if app is None:
+            app = ConfidentialClientApplication(
+                client_id,
+                authority=f"https://login.microsoftonline.com/{tenant_id}",
+                client_credential=client_secret,
+                token_cache=SerializableTokenCache(),
+                http_client=_http_session
+            )
+            cls._apps[key] = app
+        return app
+
+    @classmethod
+    def get_access_token(cls, client_id: str, client_secret: str, tenant_id: str) -> str:
         """
-        Get an access token using client credentials flow
+        Get an access token using client credentials flow.
+        The token is cached and reused until shortly before it expires.
 
         Args:
             client_id: Azure AD application client ID
@@ -42,26 +88,29 @@ class MsEwsTokenProvider:
         Returns:
             Access token string
         """
-        authority = f"https://login.microsoftonline.com/{tenant_id}"
+        key = (client_id, client_secret, tenant_id)
+        with cls._lock:
+            if cls._token and cls._token_key == key and time.monotonic() < cls._token_expiry:
+                return cls._token
 
-        app = ConfidentialClientApplication(
-            client_id,
-            authority=authority,
-            client_credential=client_secret
-        )
+            app = cls._get_app(client_id, client_secret, tenant_id)
 
-        # Scopes for EWS
-        scopes = ["https://outlook.office365.com/.default"]
+            # Scopes for EWS
+            scopes = ["https://outlook.office365.com/.default"]
 
-        result = app.acquire_token_for_client(scopes=scopes)
+            result = app.acquire_token_for_client(scopes=scopes)
 
-        if "access_token" in result:
-            logger.info("Successfully acquired access token")
-            return result["access_token"]
-        else:
-            error_msg = f"Failed to acquire token: {result.get('error_description', 'Unknown error')}"
-            logger.error(error_msg)
-            raise Exception(error_msg)
+            if "access_token" in result:
+                logger.info("Successfully acquired access token")
+                expires_in = int(result.get("expires_in", 3600))
+                cls._token = result["access_token"]
+                cls._token_key = key
+                cls._token_expiry = time.monotonic() + expires_in - cls.EXPIRY_MARGIN
+                return cls._token
+            else:
+                error_msg = f"Failed to acquire token: {result.get('error_description', 'Unknown error')}"
+                logger.error(error_msg)
+                raise Exception(error_msg)
 
 
 class OAuth2CredentialsWithToken(OAuth2AuthorizationCodeCredentials):
@@ -96,6 +145,10 @@ class MsEwsClient:
         if not all([self.client_id, self.client_secret, self.tenant_id, self.sender_address]):
             raise ValueError("Missing required environment variables. Check .env.exchange file.")
 
+        self._account = None
+        self._account_token = None
+        self._account_lock = threading.Lock()
+
         logger.info(f"Initialized EWS client for {self.sender_address}")
 
     def get_authenticated_account(self, token: str, email_address: str = None) -> Account:
@@ -124,7 +177,7 @@ class MsEwsClient:
             server=self.server,
             credentials=credentials,
             auth_type=OAUTH2,
-            version=None  # Auto-discover version
+            version=EXCHANGE_O365_VERSION
         )
 
         account = Account(
@@ -136,6 +189,35 @@ class MsEwsClient:
 
         return account
 
+    def get_account(self) -> Account:
+        """
+        Return the long-lived authenticated account for the sender mailbox.
+        The account is only rebuilt when the cached access token changes.
+
+        Returns:
+            Authenticated Account object
+        """
+        token = self.get_access_token()
+        with self._account_lock:
+            if self._account is None or self._account_token != token:
+                if self._account is not None:
+                    self._release_protocol(self._account.protocol)
+                self._account = self.get_authenticated_account(token)
+                self._account_token = token
+            return self._account
+
+    @staticmethod
+    def _release_protocol(protocol):
+        """
+        Close a protocol and evict it from exchangelib's protocol cache.
+        The cache is keyed by credentials, so every token rotation would
+        otherwise leave a dead entry holding the old token behind.
+        """
+        protocol.close()
+        for key, cached in list(CachingProtocol._protocol_cache.items()):
+            if cached is protocol:
+                CachingProtocol._protocol_cache.pop(key, None)
+
     def get_access_token(self) -> str:
         """
         Get OAuth2 access token
@@ -149,16 +231,7 @@ class MsEwsClient:
             self.tenant_id
         )
 
-    def send_message(self, subject: str, body: str, recipient: str = None, html_body: bool = True):
-        """
-        Send an email message
-
-        Args:
-            subject: Email subject
-            body: Email body content
-            recipient: Recipient email address(es) - can be string or comma-separated list
-            html_body: Whether body is HTML (default) or plain text
-        """
+    def _parse_recipients(self, recipient) -> List[Mailbox]:
         if recipient is None:
             recipient = self.recipient_address
 
@@ -170,22 +243,76 @@ class MsEwsClient:
                     recipients_list.append(Mailbox(email_address=email))
         else:
             recipients_list.append(Mailbox(email_address=recipient))
+        return recipients_list
 
-        token = self.get_access_token()
-        account = self.get_authenticated_account(token)
+    def build_message(self, account: Account, subject: str, body: str, recipient: str = None,
+                      html_body: bool = True) -> Message:
+        """
+        Build an unsent message from the sender mailbox
 
+        Args:
+            account: Authenticated Account object
+            subject: Email subject
+            body: Email body content
+            recipient: Recipient email address(es) - can be string or comma-separated list
+            html_body: Whether body is HTML (default) or plain text
+
+        Returns:
+            Message object
+        """
         msg = Message(
             account=account,
+            folder=account.sent,
             subject=subject,
             body=HTMLBody(body) if html_body else body,
-            to_recipients=recipients_list
+            to_recipients=self._parse_recipients(recipient)
         )
-
         msg.sender = Mailbox(email_address=self.sender_address)
+        return msg
+
+    def send_message(self, subject: str, body: str, recipient: str = None, html_body: bool = True):
+        """
+        Send an email message
+
+        Args:
+            subject: Email subject
+            body: Email body content
+            recipient: Recipient email address(es) - can be string or comma-separated list
+            html_body: Whether body is HTML (default) or plain text
+        """
+        account = self.get_account()
+        msg = self.build_message(account, subject, body, recipient, html_body)
         msg.send()
 
-        recipient_names = ', '.join([r.email_address for r in recipients_list])
-        logger.info(f"Message sent successfully to {recipient_names}")
+        logger.info("Message sent successfully to %s", ', '.join(r.email_address for r in msg.to_recipients))
+
+    def send_messages(self, messages: List[tuple], html_body: bool = True) -> list:
+        """
+        Send several messages with a single EWS CreateItem request
+
+        Args:
+            messages: List of (subject, body, recipient) tuples
+            html_body: Whether bodies are HTML (default) or plain text
+
+        Returns:
+            One entry per message: True if it was sent, otherwise the Exception raised for it
+        """
+        account = self.get_account()
+        items = [
+            self.build_message(account, subject, body, recipient, html_body)
+            for subject, body, recipient in messages
+        ]
+        results = account.bulk_create(
+            folder=account.sent,
+            items=items,
+            message_disposition=SEND_AND_SAVE_COPY
+        )
+
+        outcome = [r if isinstance(r, Exception) else True for r in results]
+        # Messages without an EWS response message cannot be assumed sent
+        outcome += [Exception("no response from EWS")] * (len(items) - len(outcome))
+        logger.info("Batch of %d message(s) sent (%d ok)", len(items), outcome.count(True))
+        return outcome
 
     def read_inbox(self, limit: int = 10, folder_name: str = 'inbox'):
         """
@@ -198,8 +325,7 @@ class MsEwsClient:
         Returns:
             List of message dictionaries
         """
-        token = self.get_access_token()
-        account = self.get_authenticated_account(token)
+        account = self.get_account()
 
         folder = getattr(account, folder_name, account.inbox)
         messages = []
@@ -218,25 +344,43 @@ class MsEwsClient:
         return messages
 
     def test_connection(self):
-        """Test the Exchange connection and authentication"""
+        """Test the Exchange connection and authentication (progress is logged at DEBUG)"""
         try:
-            logger.info("Testing Exchange connection...")
-            token = self.get_access_token()
-            logger.info("✓ Successfully acquired access token")
+            logger.debug("Testing Exchange connection...")
+            self.get_access_token()
+            logger.debug("✓ Successfully acquired access token")
 
-            account = self.get_authenticated_account(token)
-            logger.info(f"✓ Connected to account: {self.sender_address}")
+            account = self.get_account()
+            logger.debug("✓ Connected to account: %s", self.sender_address)
 
             # Try to access inbox to verify permissions
             inbox_count = account.inbox.total_count
-            logger.info(f"✓ Inbox access verified ({inbox_count} items)")
+            logger.debug("✓ Inbox access verified (%s items)", inbox_count)
 
             return True
         except Exception as e:
-            logger.error(f"✗ Connection test failed: {e}")
+            logger.error("✗ Connection test failed: %s", e)
             return False
 
 
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> MsEwsClient:
+    """
+    Return the process-wide MsEwsClient, creating it on first use
+
+    Returns:
+        Shared MsEwsClient instance
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = MsEwsClient()
+        return _shared_client
+
+
 def main():
     """
     Example usage and testing
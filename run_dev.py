@@ -22,6 +22,7 @@ def main():
         reload=True,  # Enable auto-reload on file changes
         reload_dirs=["./"],  # Watch current directory for changes
         reload_includes=["*.py", "*.html", ".env"],  # Watch these file types
+        reload_excludes=[".venv", "venv", ".git", "node_modules", "__pycache__"],  # Existing dirs are excluded recursively (needs watchfiles)
         log_level="info"
     )
 